@@ -0,0 +1,98 @@
+"""Throughput of the same receive loop on the gevent and asyncio backends.
+Python 3 only.
+
+``send``: messages per second through ``<<`` and a selective receive.
+``call``: round trips per second through ``|`` and ``respond()``.
+"""
+
+import asyncio
+import time
+import gevent
+from erlangmode import Mailbox
+from erlangmode.aio import AsyncioBackend
+
+
+MESSAGES = 100000
+CALLS = 20000
+
+
+def gevent_send():
+    mb = Mailbox()
+    def consumer():
+        for receive in mb:
+            if receive('stop'):
+                break
+            if receive('data', int):
+                pass
+    start = time.time()
+    g = gevent.spawn(consumer)
+    for i in range(MESSAGES):
+        mb << ('data', i)
+    mb << 'stop'
+    g.join()
+    return MESSAGES / (time.time() - start)
+
+
+def gevent_call():
+    mb = Mailbox()
+    def server():
+        for receive in mb:
+            if receive(int):
+                receive.respond(receive.message)
+    g = gevent.spawn(server)
+    start = time.time()
+    for i in range(CALLS):
+        (mb | i).get()
+    elapsed = time.time() - start
+    g.kill()
+    return CALLS / elapsed
+
+
+async def asyncio_send():
+    mb = Mailbox(backend=AsyncioBackend())
+    async def consumer():
+        async for receive in mb:
+            if receive('stop'):
+                break
+            if receive('data', int):
+                pass
+    start = time.time()
+    task = asyncio.ensure_future(consumer())
+    for i in range(MESSAGES):
+        mb << ('data', i)
+    mb << 'stop'
+    await task
+    return MESSAGES / (time.time() - start)
+
+
+async def asyncio_call():
+    mb = Mailbox(backend=AsyncioBackend())
+    async def server():
+        async for receive in mb:
+            if receive(int):
+                receive.respond(receive.message)
+    task = asyncio.ensure_future(server())
+    start = time.time()
+    for i in range(CALLS):
+        await (mb | i)
+    elapsed = time.time() - start
+    task.cancel()
+    return CALLS / elapsed
+
+
+def main():
+    print('gevent   send: %8d msg/s   call: %8d calls/s' % (
+        gevent_send(), gevent_call()))
+    print('asyncio  send: %8d msg/s   call: %8d calls/s' % (
+        asyncio.run(asyncio_send()), asyncio.run(asyncio_call())))
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    print('uvloop   send: %8d msg/s   call: %8d calls/s' % (
+        asyncio.run(asyncio_send()), asyncio.run(asyncio_call())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Latency of an actor that shares the hub with a flooded one.
+
+The flooding actor always has messages queued, and thus never blocks. The
+latency-sensitive actor answers pings; without a reduction budget, those
+pings are only answered once the flood is over.
+"""
+
+import time
+import gevent
+from erlangmode import Mailbox
+
+
+FLOOD = 200000
+PINGS = 200
+
+
+def flooder(mailbox):
+    # Every message processed queues another one, so the mailbox is never
+    # empty until the flood is over.
+    mailbox << 0
+    for receive in mailbox:
+        if receive(FLOOD):
+            break
+        if receive(int):
+            mailbox << receive.message + 1
+
+
+def responder(mailbox):
+    for receive in mailbox:
+        if receive('ping'):
+            pass
+
+
+def run(**options):
+    flood_mb, ping_mb = Mailbox(**options), Mailbox(**options)
+    latencies = []
+    def pinger():
+        for i in range(PINGS):
+            start = time.time()
+            (ping_mb | 'ping').get()
+            latencies.append(time.time() - start)
+            gevent.sleep(0.0005)
+
+    greenlets = [gevent.spawn(responder, ping_mb), gevent.spawn(pinger)]
+    gevent.sleep(0.001)
+    flood = gevent.spawn(flooder, flood_mb)
+    gevent.joinall(greenlets[1:] + [flood])
+    greenlets[0].kill()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(int(len(latencies) * p), len(latencies)-1)]
+    return pct(0.5), pct(0.99), latencies[-1]
+
+
+def main():
+    for label, options in (
+            ('no budget', dict(reductions=None)),
+            ('reductions=2000', dict(reductions=2000)),
+            ('reductions=200', dict(reductions=200)),
+            ('reduction_time=1ms', dict(reductions=None, reduction_time=0.001))):
+        p50, p99, worst = run(**options)
+        print('%-20s p50=%8.3fms  p99=%8.3fms  max=%8.3fms' % (
+            label, p50*1000, p99*1000, worst*1000))
+
+
+if __name__ == '__main__':
+    main()
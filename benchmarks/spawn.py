@@ -0,0 +1,54 @@
+"""Spawn and teardown of short-lived actors: ``Actor`` plus
+``spawn_and_link``, against ``ActorPool.spawn``.
+
+Each actor answers a single request and exits.
+"""
+
+import time
+import gevent
+from erlangmode import Actor, ActorPool, spawn_and_link
+
+
+ACTORS = 50000
+BATCH = 500
+
+
+def handler(mailbox):
+    for receive in mailbox:
+        if receive(object):
+            receive.respond(receive.message)
+            break
+
+
+def current():
+    def spawn():
+        actor = Actor()
+        spawn_and_link(lambda: handler(actor.mailbox))
+        return actor
+    return spawn
+
+
+def pooled():
+    pool = ActorPool(size=BATCH, prewarm=BATCH)
+    return lambda: pool.spawn(handler, link=True)
+
+
+def run(spawn):
+    start = time.time()
+    for i in range(ACTORS // BATCH):
+        replies = [spawn() | n for n in range(BATCH)]
+        for reply in replies:
+            reply.get()
+    # Let the last batch exit.
+    gevent.sleep(0)
+    return ACTORS / (time.time() - start)
+
+
+def main():
+    for label, spawn in (('Actor + spawn_and_link', current()),
+                         ('ActorPool.spawn', pooled())):
+        print('%-24s %8d actors/s' % (label, run(spawn)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Restart latency and throughput of a supervisor under a crash loop.
+
+Latency is the time from a child being told to crash until its next
+incarnation is running. Throughput is the number of restarts per second of a
+child that crashes as soon as it is started.
+"""
+
+import time
+import gevent
+from gevent.queue import Queue
+from erlangmode import Mailbox, Supervisor, ONE_FOR_ONE, ONE_FOR_ALL
+
+
+RESTARTS = 2000
+DURATION = 1.0
+
+
+def latency(strategy, siblings):
+    started = Queue()
+    def child(mailbox):
+        started.put(time.time())
+        for receive in mailbox:
+            if receive('crash'):
+                raise ValueError()
+
+    sup = Supervisor(strategy=strategy, intensity=RESTARTS*2, period=60)
+    crasher = sup.add_child(child, mailbox=Mailbox())
+    for i in range(siblings):
+        sup.add_child(lambda mailbox: gevent.sleep(60), mailbox=Mailbox())
+    sup.start()
+    started.get()
+
+    latencies = []
+    for i in range(RESTARTS):
+        start = time.time()
+        crasher.mailbox << 'crash'
+        latencies.append(started.get() - start)
+    sup.stop()
+
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * .99)]
+
+
+def throughput():
+    count = [0]
+    def child():
+        count[0] += 1
+        raise ValueError()
+
+    sup = Supervisor(intensity=10**9, period=DURATION)
+    sup.add_child(child)
+    sup.start()
+    gevent.sleep(DURATION)
+    sup.stop()
+    return count[0] / DURATION
+
+
+def main():
+    # Keep the crashing children from flooding stderr.
+    gevent.get_hub().print_exception = lambda *args: None
+
+    for strategy, siblings in ((ONE_FOR_ONE, 0), (ONE_FOR_ONE, 10),
+                               (ONE_FOR_ALL, 10)):
+        p50, p99 = latency(strategy, siblings)
+        print('%s, %2d siblings: p50=%.3fms  p99=%.3fms' % (
+            strategy, siblings, p50*1000, p99*1000))
+    print('crash loop: %d restarts/s' % throughput())
+
+
+if __name__ == '__main__':
+    main()
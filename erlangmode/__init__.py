@@ -1,3 +1,10 @@
-from mailbox import *
-from utils import *
-from links import *
+from .mailbox import *
+from .backend import *
+from .clock import *
+from .reply import *
+from .utils import *
+from .links import *
+from .multicall import *
+from .registry import *
+from .supervisor import *
+from .pool import *
@@ -0,0 +1,144 @@
+"""Mailboxes on asyncio (Python 3 only).
+
+A mailbox using the ``AsyncioBackend`` is iterated with ``async for``, and
+``|`` returns a future::
+
+    mailbox = Mailbox(backend=AsyncioBackend())
+
+    async def loop():
+        async for receive in mailbox:
+            if receive('sum', int, int):
+                a, b = receive.match
+                receive.respond(a + b)
+            if receive(timeout=5):
+                return
+
+    assert await (mailbox | ('sum', 2, 3)) == 5
+
+Matching, selective receive, timeouts and the reduction budget work exactly
+as they do with gevent; see ``erlangmode.mailbox``.
+"""
+
+import asyncio
+import time
+
+from .mailbox import YIELD, WAIT
+
+
+__all__ = ('AsyncioBackend', 'AsyncReply', 'AsyncioTimer')
+
+
+class AsyncReply(asyncio.Future):
+    """The reply to a ``|`` request; await it to get the response."""
+
+    def set(self, value=None):
+        if not self.done():
+            self.set_result(value)
+
+
+class AsyncioTimer(object):
+    """Like ``erlangmode.utils.Timer``, but using the asyncio loop."""
+
+    __slots__ = ('_loop', '_seconds', '_callable', '_handle')
+
+    def __init__(self, loop, seconds, callable):
+        self._loop = loop
+        self._seconds, self._callable = seconds, callable
+        self._schedule()
+
+    def _schedule(self):
+        if self._seconds is not None:
+            self._handle = self._loop.call_later(self._seconds, self._callable)
+        else:
+            self._handle = None
+
+    def cancel(self):
+        if self._handle:
+            self._handle.cancel()
+
+    def reset(self):
+        self.cancel()
+        self._schedule()
+
+
+class AsyncioBackend(object):
+    """See ``erlangmode.backend``. ``loop`` defaults to the current event
+    loop at the time it is needed.
+    """
+
+    Empty = asyncio.QueueEmpty
+    blocking = False
+
+    def __init__(self, loop=None):
+        self._loop = loop
+
+    @property
+    def loop(self):
+        return self._loop or asyncio.get_event_loop()
+
+    def queue(self):
+        return asyncio.Queue()
+
+    async def get(self, queue, timeout=None):
+        if timeout == 0:
+            return queue.get_nowait()
+        if timeout is None:
+            return await queue.get()
+        try:
+            return await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.QueueEmpty()
+
+    def reply(self):
+        return AsyncReply(loop=self.loop)
+
+    def timer(self, seconds, callable):
+        return AsyncioTimer(self.loop, seconds, callable)
+
+    def sleep(self, seconds=0):
+        return asyncio.sleep(seconds)
+
+    def time(self):
+        # The clock the default event loop uses.
+        return time.monotonic()
+
+    def spawn(self, func, *args):
+        """Run the coroutine function ``func`` as a task."""
+        return self.loop.create_task(func(*args))
+
+
+class AsyncReceive(object):
+    """What ``async for`` iterates over; drives the receive engine of a
+    mailbox, awaiting where the gevent version would block.
+    """
+
+    __slots__ = ('_mailbox', '_engine')
+
+    def __init__(self, mailbox):
+        self._mailbox = mailbox
+        # Once we are dropped after a ``break``, so is the engine, which
+        # then runs its cleanup right away.
+        self._engine = mailbox._receive()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        mailbox, engine = self._mailbox, self._engine
+        backend = mailbox.backend
+        try:
+            instruction = next(engine)
+            while True:
+                if instruction is YIELD:
+                    await asyncio.sleep(0)
+                    instruction = next(engine)
+                elif isinstance(instruction, WAIT):
+                    try:
+                        item = await backend.get(mailbox._mailbox, instruction.seconds)
+                    except backend.Empty:
+                        item = None
+                    instruction = engine.send(item)
+                else:
+                    return instruction
+        except StopIteration:
+            raise StopAsyncIteration()
@@ -0,0 +1,107 @@
+"""The event loop a mailbox runs on.
+
+Mailboxes only ever talk to their backend for anything that involves
+scheduling: queues, reply objects, timers and spawning. By default, that
+is the ``GeventBackend``. To run on asyncio instead (see ``erlangmode.aio``),
+pass a different backend to the mailbox::
+
+    from erlangmode.aio import AsyncioBackend
+    mailbox = Mailbox(backend=AsyncioBackend())
+
+    async for receive in mailbox:
+        ...
+
+or change the default for all mailboxes created afterwards::
+
+    set_backend(AsyncioBackend())
+
+A backend provides:
+
+``queue()``
+    An unbounded queue with ``put_nowait()``, ``get_nowait()``,
+    ``empty()`` and ``qsize()``.
+``Empty``
+    The exception ``get_nowait()`` raises.
+``get(queue, timeout)``
+    Take an item from ``queue``, waiting at most ``timeout`` seconds
+    (forever if ``None``, not at all if ``0``), and raise ``Empty`` if
+    there is none.
+``reply()``
+    A reply object for the ``|`` operator; see ``erlangmode.reply``.
+``timer(seconds, callable)``
+    A timer with ``cancel()`` and ``reset()``; see ``send_after``.
+``sleep(seconds)``
+    Wait; ``sleep(0)`` yields to other tasks.
+``time()``
+    The current time, in seconds.
+``spawn(func, *args)``
+    Run ``func(*args)`` concurrently, say the loop of an actor, and return
+    the greenlet or task.
+``blocking``
+    Whether the backend can block. Mailboxes on blocking backends are
+    iterated with ``for``, the others with ``async for``.
+
+On backends that cannot block (asyncio), ``get`` and ``sleep`` return
+awaitables instead, and ``spawn`` takes a coroutine function.
+
+Links and actor pools rely on gevent greenlets, and are only available
+with gevent.
+"""
+
+import gevent
+from gevent.queue import Queue, Empty
+from .clock import RealClock
+from .reply import Reply
+
+
+__all__ = ('GeventBackend', 'get_backend', 'set_backend')
+
+
+class GeventBackend(object):
+    """Anything that depends on time is delegated to ``clock``, which
+    defaults to a ``RealClock``; see ``erlangmode.clock``.
+    """
+
+    Empty = Empty
+    blocking = True
+
+    def __init__(self, clock=None):
+        self.clock = clock or RealClock()
+
+    def queue(self):
+        return Queue()
+
+    def get(self, queue, timeout=None):
+        return self.clock.get(queue, timeout)
+
+    def reply(self):
+        return Reply.acquire()
+
+    def timer(self, seconds, callable):
+        return self.clock.timer(seconds, callable)
+
+    def sleep(self, seconds=0):
+        self.clock.sleep(seconds)
+
+    def time(self):
+        return self.clock.time()
+
+    def spawn(self, func, *args):
+        return gevent.spawn(func, *args)
+
+
+_backend = None
+
+
+def get_backend():
+    """Return the backend used by mailboxes that were not given one."""
+    global _backend
+    if _backend is None:
+        _backend = GeventBackend()
+    return _backend
+
+
+def set_backend(backend):
+    """Change the default backend."""
+    global _backend
+    _backend = backend
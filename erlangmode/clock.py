@@ -0,0 +1,153 @@
+"""Clocks for the gevent backend.
+
+By default, receive timeouts and ``send_after`` timers use real time. For
+tests, use a ``VirtualClock`` instead::
+
+    set_backend(GeventBackend(clock=VirtualClock()))
+
+Virtual time only advances when every greenlet is blocked, and then jumps
+straight to the next pending deadline. A receive with ``timeout=60``
+thus returns immediately if nothing else can happen in the meantime, and
+timers with the same deadline always fire in the order they were created.
+
+Only time spent waiting is virtual; a busy greenlet does not advance the
+clock. ``reduction_time`` budgets measure time spent running, and thus
+always use real time. The virtual clock requires gevent 1.1 or later.
+"""
+
+import heapq
+import itertools
+import sys
+import time
+import gevent
+from gevent.hub import Waiter
+from gevent.queue import Empty
+from gevent.timeout import Timeout
+from .utils import Timer
+
+
+__all__ = ('RealClock', 'VirtualClock')
+
+
+class RealClock(object):
+    """Wall time, and real libev timers."""
+
+    def time(self):
+        return time.time()
+
+    def timer(self, seconds, callable):
+        return Timer(seconds, callable)
+
+    def get(self, queue, timeout=None):
+        if timeout == 0:
+            return queue.get_nowait()
+        return queue.get(timeout=timeout)
+
+    def sleep(self, seconds=0):
+        gevent.sleep(seconds)
+
+
+class VirtualTimer(object):
+    """Like ``erlangmode.utils.Timer``, but on a ``VirtualClock``."""
+
+    __slots__ = ('_clock', '_seconds', '_callable', '_entry')
+
+    def __init__(self, clock, seconds, callable):
+        self._clock = clock
+        self._seconds, self._callable = seconds, callable
+        self._schedule()
+
+    def _schedule(self):
+        if self._seconds is not None:
+            self._entry = self._clock._schedule(self._seconds, self._callable)
+        else:
+            self._entry = None
+
+    def cancel(self):
+        if self._entry:
+            self._clock._cancel(self._entry)
+
+    def reset(self):
+        self.cancel()
+        self._schedule()
+
+
+class VirtualClock(object):
+
+    def __init__(self, start=0.0):
+        self._now = start
+        # Heap of [deadline, sequence, callable] entries. Cancelled entries
+        # stay in the heap, with the callable set to None.
+        self._timers = []
+        self._sequence = itertools.count()
+        self._runner = None
+
+    def time(self):
+        return self._now
+
+    def timer(self, seconds, callable):
+        return VirtualTimer(self, seconds, callable)
+
+    def _schedule(self, seconds, callable):
+        entry = [self._now + seconds, next(self._sequence), callable]
+        heapq.heappush(self._timers, entry)
+        if self._runner is None:
+            self._runner = gevent.spawn(self._run)
+        return entry
+
+    def _cancel(self, entry):
+        entry[2] = None
+
+    def _run(self):
+        try:
+            while True:
+                # Wait until no other greenlet can run.
+                gevent.idle()
+                while self._timers and self._timers[0][2] is None:
+                    heapq.heappop(self._timers)
+                if not self._timers:
+                    return
+                deadline, _, callable = heapq.heappop(self._timers)
+                self._now = max(self._now, deadline)
+                try:
+                    callable()
+                except:
+                    gevent.get_hub().handle_error(callable, *sys.exc_info())
+        finally:
+            self._runner = None
+
+    def get(self, queue, timeout=None):
+        if timeout == 0:
+            return queue.get_nowait()
+        if timeout is None:
+            return queue.get()
+
+        current = gevent.getcurrent()
+        expired = Timeout()
+        hub = gevent.get_hub()
+        def expire():
+            # The throw is scheduled, not done right away, as greenlets may
+            # only be switched to from the hub. Make sure we have not been
+            # woken up by a message in the meantime.
+            if entry[2] is not None:
+                entry[2] = None
+                current.throw(expired)
+        entry = self._schedule(timeout, lambda: hub.loop.run_callback(expire))
+        try:
+            return queue.get()
+        except Timeout as e:
+            if e is not expired:
+                raise
+            raise Empty()
+        finally:
+            self._cancel(entry)
+
+    def sleep(self, seconds=0):
+        if seconds <= 0:
+            gevent.sleep(0)
+            return
+        waiter = Waiter()
+        hub = gevent.get_hub()
+        self._schedule(seconds,
+                       lambda: hub.loop.run_callback(waiter.switch, None))
+        waiter.get()
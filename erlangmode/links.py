@@ -9,8 +9,9 @@ class LinkedFailed(Exception):
 
     msg = "%r failed with %s: %s"
 
-    def __init__(self, source):
-        exception = source.exception
+    def __init__(self, source, exception=None):
+        if exception is None:
+            exception = source.exception
         try:
             excname = exception.__class__.__name__
         except:
@@ -18,17 +19,24 @@ class LinkedFailed(Exception):
         Exception.__init__(self, self.msg % (source, excname, exception))
 
 
-def spawn_and_link(func):
+def spawn_and_link(func, trap_exit=None):
     """Spawn as a greenlet, and link to current greenlet.
 
     If the spawned greenlet exits abnormally (with an exception), then a
     ``LinkedFailed`` exception will be raised in the linked greenlet.
 
+    If ``trap_exit`` is given, the current greenlet is not killed. Instead,
+    the message ``('EXIT', greenlet, exception)`` is sent to ``trap_exit``
+    whenever the spawned greenlet exits, ``exception`` being ``None`` if it
+    exited normally.
+
     Gevent used to have this functionality built in, but it was removed:
     https://groups.google.com/d/topic/gevent/gZF5HcR1VqI/discussion
     """
-    parent = gevent.getcurrent()
     g = gevent.spawn(func)
-    g.link_exception(receiver=lambda failed: gevent.kill(parent, LinkedFailed(failed)))
+    if trap_exit is not None:
+        g.link(lambda exited: trap_exit << ('EXIT', exited, exited.exception))
+    else:
+        parent = gevent.getcurrent()
+        g.link_exception(lambda failed: gevent.kill(parent, LinkedFailed(failed)))
     return g
-
@@ -46,7 +46,8 @@ immediate result from the message processor::
     result = mailbox | 5
     result.get()
 
-``result`` is a ``gevent`` ``ASyncResult`` instance. By using ``|`` instead of
+``result`` is a ``Reply`` instance, a lightweight version of ``gevent``'s
+``AsyncResult`` (see ``erlangmode.reply``). By using ``|`` instead of
 ``<<`` you will get such an object. ``get()`` blocks the current greenlet until
 the message has been processed. The return value will be ``None``, or a value
 set by the mailbox processor::
@@ -92,6 +93,18 @@ The timeout clause must be the last one, and only one timeout clause can exist
 (both restrictions are enforced).
 
 
+A receive loop that keeps finding messages never blocks, and thus would never
+yield to other greenlets. Like the BEAM, a mailbox therefore has a reduction
+budget: After ``reductions`` messages, or after ``reduction_time`` seconds
+without blocking, the loop yields to the hub before handing down the next
+message::
+
+    mailbox = Mailbox(reductions=500, reduction_time=0.001)
+
+Either limit can be disabled by passing ``None``. An ``Actor`` passes these
+options on to its mailbox.
+
+
 There is a catch-all receive, that in combination with the timeout can be used
 to clear the mailbox::
 
@@ -122,11 +135,17 @@ http://www.python.org/dev/peps/pep-0377/
 
 import time
 import types
-from gevent.event import AsyncResult
-from gevent.queue import Queue, Empty
+from .backend import get_backend
+
+
+__all__ = ('Mailbox', 'Actor', 'Matcher', 'MessageReceiver', 'ActorExited')
+
 
+# Number of messages a receive loop may process before it yields to the hub.
+DEFAULT_REDUCTIONS = 2000
 
-__all__ = ('Mailbox', 'Actor', 'Matcher', 'MessageReceiver')
+# Python 3 has no old-style classes.
+class_types = (type, types.ClassType) if hasattr(types, 'ClassType') else (type,)
 
 
 # Special message value being passed around for timeout support.
@@ -137,6 +156,31 @@ class TIMEOUT(object):
         self.seconds = None
 
 
+# Instructions from the receive engine to the loop driving it: Yield to
+# other greenlets/tasks, or wait for a message to arrive.
+YIELD = object()
+
+class WAIT(object):
+    __slots__ = ['seconds']
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+
+class ActorExited(Exception):
+    """A request was sent to a mailbox whose actor has exited."""
+
+
+# Stands in for the queues of a mailbox that were handed on to another one.
+# Messages are dropped, but requests fail right away rather than never being
+# answered.
+class DETACHED(object):
+    @staticmethod
+    def put_nowait(item):
+        responder, message = item
+        if responder is not None:
+            responder.set_exception(ActorExited(message))
+
+
 class Matcher(object):
     """Helper that matches a wrapped message against a clause.
 
@@ -156,7 +200,7 @@ class Matcher(object):
 
     def __call__(self, *args, **kwargs):
         timeout_seconds = kwargs.pop('timeout', None)
-        assert not kwargs, 'Unsupported kwarg given: %s' % kwargs.keys()[0]
+        assert not kwargs, 'Unsupported kwarg given: %s' % list(kwargs)[0]
 
         # Never match two clauses.
         if self._consumed:
@@ -202,6 +246,10 @@ class Matcher(object):
 
 class MessageReceiver(object):
 
+    # The backend that creates reply objects for ``|``; ``None`` for the
+    # default backend.
+    backend = None
+
     def __lshift__(self, other):
         """<< syntax to add a message to the mailbox::
 
@@ -211,13 +259,13 @@ class MessageReceiver(object):
         return self
 
     def __or__(self, other):
-        """| syntax to add a message to a mailbox and get an ``ASyncResult``
+        """| syntax to add a message to a mailbox and get a ``Reply``
         instance that triggers when the message has been processed::
 
             result = mailbox | 1
             result.get()
        """
-        result = AsyncResult()
+        result = (self.backend or get_backend()).reply()
         self.receive_message(other, responder=result)
         return result
 
@@ -227,19 +275,111 @@ class MessageReceiver(object):
 
 class Mailbox(MessageReceiver):
     """Implements an Erlang-like mailbox.
+
+    ``backend`` defaults to the one returned by ``get_backend()``.
     """
 
-    def __init__(self):
-        self._mailbox = Queue()
-        self._save_queue = Queue()
+    def __init__(self, reductions=DEFAULT_REDUCTIONS, reduction_time=None,
+                 backend=None, queues=None):
+        self.backend = backend or get_backend()
+        if queues is not None:
+            # A pair of empty queues, as returned by ``_detach()``.
+            self._mailbox, self._save_queue = queues
+        else:
+            self._mailbox = self.backend.queue()
+            self._save_queue = self.backend.queue()
         self._old_save_queues = []
+        self.reductions = reductions
+        self.reduction_time = reduction_time
+        # The budget is tracked per mailbox rather than per loop, since it
+        # is common to break out and immediately iterate again. The slice
+        # measures time spent running, so it always uses real time, even
+        # if the backend has a virtual clock.
+        self._reductions_used = 0
+        self._slice_start = time.time()
+
+    def _reset_budget(self):
+        self._reductions_used = 0
+        if self.reduction_time is not None:
+            self._slice_start = time.time()
+
+    def _budget_exhausted(self):
+        if self.reductions is not None and \
+                self._reductions_used >= self.reductions:
+            return True
+        if self.reduction_time is not None and \
+                time.time() - self._slice_start >= self.reduction_time:
+            return True
+        return False
 
     def receive_message(self, message, responder=None):
-        self._mailbox.put((responder, message))
+        self._mailbox.put_nowait((responder, message))
+
+    def _detach(self):
+        """Take the queues away from this mailbox, so that they can be
+        reused by another one. Returns ``None`` if they were not empty.
+
+        Messages still queued, and messages sent to this mailbox afterwards,
+        are dropped, as they would be for a dead Erlang process; requests
+        sent with ``|`` fail with ``ActorExited``.
+        """
+        queues = [self._mailbox, self._save_queue] + self._old_save_queues
+        self._mailbox = self._save_queue = DETACHED
+        del self._old_save_queues[:]
+        empty = True
+        for q in queues:
+            while not q.empty():
+                empty = False
+                DETACHED.put_nowait(q.get_nowait())
+        if not empty:
+            return None
+        return queues[0], queues[1]
 
     def __iter__(self):
-        """The design challenge is this: In order to be able to trigger the
-        ``ASyncResult`` event for a message being processed, as we might have
+        """Receive messages, blocking the current greenlet while waiting.
+        """
+        if not self.backend.blocking:
+            raise TypeError('A mailbox on %s is iterated with "async for"' %
+                            type(self.backend).__name__)
+        engine = self._receive()
+        try:
+            instruction = next(engine)
+            while True:
+                if instruction is YIELD:
+                    self.backend.sleep(0)
+                    instruction = next(engine)
+                elif isinstance(instruction, WAIT):
+                    try:
+                        item = self.backend.get(self._mailbox, instruction.seconds)
+                    except self.backend.Empty:
+                        item = None
+                    instruction = engine.send(item)
+                else:
+                    yield instruction
+                    instruction = next(engine)
+        except StopIteration:
+            return
+        finally:
+            engine.close()
+
+    def __aiter__(self):
+        """Receive messages with ``async for``, on the asyncio backend.
+        """
+        if self.backend.blocking:
+            raise TypeError('A mailbox on %s is iterated with "for"' %
+                            type(self.backend).__name__)
+        from .aio import AsyncReceive
+        return AsyncReceive(self)
+
+    def _receive(self):
+        """The receive engine, shared by all backends. It yields the
+        ``Matcher`` instances that are handed to the user, and the
+        ``YIELD`` and ``WAIT`` instructions, which the driving loop
+        carries out. After a ``WAIT``, the loop sends back the message
+        that arrived, or ``None`` on timeout.
+
+        The design challenge is this: In order to be able to trigger the
+        ``Reply`` event for a message being processed, as we might have
         to if a ``responder`` is set, even if the user does not explicitly sets
         a value, we need a way to run code after the yield. Here are the
         options:
@@ -275,7 +415,7 @@ class Mailbox(MessageReceiver):
         # we cannot run any code after a ``break``. Thus, we cannot be sure
         # that this __iter__ will even empty the current save queue fully.
         self._old_save_queues.insert(0, self._save_queue)
-        self._save_queue = Queue()
+        self._save_queue = self.backend.queue()
 
         # Returns the first non-empty save_queue, cleans out empty save
         # queues, returns mailbox if all save_queues empty.
@@ -287,9 +427,15 @@ class Mailbox(MessageReceiver):
                 del self._old_save_queues[0]
             return self._mailbox
 
+        Empty = self.backend.Empty
         timeout = None
         timeout_used = 0
         while True:
+            if self._budget_exhausted():
+                # Give other greenlets a chance to run.
+                yield YIELD
+                self._reset_budget()
+
             try:
                 responder, message = queue().get_nowait()
             except Empty:
@@ -302,26 +448,24 @@ class Mailbox(MessageReceiver):
                     yield Matcher(timeout)
 
                 # Try again with a timeout:
-                start = time.time()
-                try:
-                    # TODO: How about using a `Timeout` instead of this arithmetic.
-                    block = True
-                    actual_timeout = max(timeout.seconds - timeout_used, 0) \
-                        if timeout.seconds is not None else None
-                    if actual_timeout == 0:
-                        block = False
-                        actual_timeout = None
-                    responder, message = queue().get(timeout=actual_timeout, block=block)
-                except Empty:
+                start = self.backend.time()
+                actual_timeout = max(timeout.seconds - timeout_used, 0) \
+                    if timeout.seconds is not None else None
+                item = yield WAIT(actual_timeout)
+                if item is None:
                     # Timeout failed, run the timeout clause, by handing
                     # down a special object.
                     assert timeout.seconds is not None
                     yield Matcher(TIMEOUT(run=True))
                     # And we are done.
                     return
-                else:
-                    timeout_used += (time.time() - start)
+                responder, message = item
+                timeout_used += (self.backend.time() - start)
+                if actual_timeout != 0:
+                    # We had to wait, so other greenlets got to run.
+                    self._reset_budget()
 
+            self._reductions_used += 1
             try:
                 # Hand down the message
                 matcher = Matcher(message)
@@ -329,12 +473,11 @@ class Mailbox(MessageReceiver):
             finally:
                 if not matcher._consumed:
                     # Remember for the next time the mailbox is iterated.
-                    self._save_queue.put((responder, message))
+                    self._save_queue.put_nowait((responder, message))
                 elif responder:
                     responder.set(matcher._response)
 
 
-
 tuplify = lambda v: v if isinstance(v, tuple) else (v,)
 
 
@@ -353,7 +496,7 @@ def match(pattern, message):
 
     groups = []
     for p, m in zip(pattern, message):
-        if isinstance(p, (types.ClassType, type)):
+        if isinstance(p, class_types):
             if isinstance(m, p):
                 groups.append(m)
                 continue
@@ -381,10 +524,16 @@ def match(pattern, message):
 class Actor(MessageReceiver):
     """An object that can be sernt messages directly (using the << and |
     operators, but exposes them via a ``mailbox`` attribute.
+
+    Keyword arguments are passed on to the ``Mailbox``.
     """
 
-    def __init__(self):
-        self.mailbox = Mailbox()
+    def __init__(self, **mailbox_options):
+        self.mailbox = Mailbox(**mailbox_options)
+
+    @property
+    def backend(self):
+        return self.mailbox.backend
 
     def receive_message(self, message, responder=None):
         self.mailbox.receive_message(message, responder)
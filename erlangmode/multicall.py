@@ -0,0 +1,126 @@
+"""Send a request to many receivers and gather the replies.
+
+Using ``|`` on every receiver allocates an ``AsyncResult`` per request, and
+collecting the replies means one ``get()`` after another. Instead::
+
+    replies, errors = multi_call(mailboxes, 'status', timeout=1)
+
+sends the message to all receivers, and waits on a single event until every
+receiver has processed it, or until the deadline passes. ``replies`` is a list
+of ``(receiver, value)`` tuples, ``errors`` a list of ``(receiver, exception)``
+tuples, both in the order the receivers were given. A receiver that did not
+respond in time is reported with a ``gevent.Timeout`` exception, the same
+instance for all of them.
+
+The receivers respond as they would to ``|``, i.e. via
+``receive.respond()``, or implicitly with ``None``.
+
+If the requests are not all the same, or are not all known at once, use a
+``Pipeline``::
+
+    calls = Pipeline()
+    calls.call(users, ('get', 42))
+    calls.call(sessions, ('list', 42))
+    replies, errors = calls.gather(timeout=1)
+"""
+
+from gevent.event import Event
+from gevent.timeout import Timeout
+
+
+__all__ = ('multi_call', 'Pipeline')
+
+
+# Marks a reply slot that has not been filled yet.
+_PENDING = object()
+
+
+class _Responder(object):
+    """Handed to the receiver in place of an ``AsyncResult``; writes the
+    response into the collector slot it belongs to.
+    """
+    __slots__ = ('_collector', '_index')
+
+    def __init__(self, collector, index):
+        self._collector, self._index = collector, index
+
+    def set(self, value=None):
+        self._collector._resolve(self._index, value, None)
+
+    def set_exception(self, exception):
+        self._collector._resolve(self._index, None, exception)
+
+
+class Pipeline(object):
+    """Collects the replies of any number of requests, waiting on a single
+    event for all of them.
+    """
+
+    def __init__(self):
+        self._receivers = []
+        self._values = []
+        self._exceptions = []
+        self._pending = 0
+        self._closed = False
+        self._event = Event()
+
+    def call(self, receiver, message):
+        """Send ``message`` to ``receiver``. The reply will be part of the
+        result of ``gather()``.
+        """
+        assert not self._closed, 'Replies have already been gathered'
+        index = len(self._receivers)
+        self._receivers.append(receiver)
+        self._values.append(_PENDING)
+        self._exceptions.append(None)
+        self._pending += 1
+        self._event.clear()
+        receiver.receive_message(message, responder=_Responder(self, index))
+        return self
+
+    def _resolve(self, index, value, exception):
+        # Late replies, and a second response for the same request, are
+        # dropped.
+        if self._closed or self._values[index] is not _PENDING:
+            return
+        self._values[index] = value
+        self._exceptions[index] = exception
+        self._pending -= 1
+        if not self._pending:
+            self._event.set()
+
+    def gather(self, timeout=None):
+        """Wait until all requests have been processed, or ``timeout``
+        seconds have passed. Returns ``(replies, errors)``.
+
+        Replies that arrive after this returns are discarded, so calling it
+        a second time does not wait again.
+        """
+        if self._pending and not self._closed:
+            self._event.wait(timeout)
+        self._closed = True
+
+        replies, errors = [], []
+        # All receivers that missed the deadline share one exception.
+        expired = None
+        for receiver, value, exception in zip(
+                self._receivers, self._values, self._exceptions):
+            if value is _PENDING:
+                if expired is None:
+                    expired = Timeout(timeout)
+                errors.append((receiver, expired))
+            elif exception is not None:
+                errors.append((receiver, exception))
+            else:
+                replies.append((receiver, value))
+        return replies, errors
+
+
+def multi_call(receivers, message, timeout=None):
+    """Send ``message`` to all ``receivers``, and return ``(replies, errors)``
+    once all have responded, or ``timeout`` seconds have passed.
+    """
+    pipeline = Pipeline()
+    for receiver in receivers:
+        pipeline.call(receiver, message)
+    return pipeline.gather(timeout)
@@ -0,0 +1,110 @@
+"""Cheap spawning of short-lived actors.
+
+Starting an actor the usual way means a new ``Mailbox`` with two new queues
+and a new greenlet, plus a closure if it is linked. An ``ActorPool`` keeps
+finished greenlets and the queues of finished actors around for reuse::
+
+    pool = ActorPool(size=1000, prewarm=100)
+
+    def handler(mailbox):
+        for receive in mailbox:
+            if receive('request', object):
+                receive.respond(process(receive.match[0]))
+                break
+
+    mailbox = pool.spawn(handler, link=True)
+    result = (mailbox | ('request', data)).get()
+
+``spawn`` calls ``func`` with a fresh mailbox in one of the pooled
+greenlets, and returns the mailbox. With ``link=True``, the calling
+greenlet is killed with ``LinkedFailed`` if ``func`` fails, as with
+``spawn_and_link``.
+
+When ``func`` returns, the greenlet goes back to the pool, and so do the
+queues of the mailbox, if they are empty. The mailbox itself is not
+reused; messages left in it or still sent to it are dropped, and requests
+fail with ``ActorExited``. At most ``size`` greenlets and
+``size`` pairs of queues are kept; ``prewarm`` greenlets are started right
+away.
+
+Since pooled greenlets are reused, they cannot be killed or joined
+individually.
+"""
+
+import sys
+import gevent
+from gevent.hub import Waiter
+from .mailbox import Mailbox
+from .backend import get_backend
+from .links import LinkedFailed
+from .utils import run_callback
+
+
+__all__ = ('ActorPool',)
+
+
+class _Worker(object):
+    """A pooled greenlet, and the job it is to run next."""
+
+    __slots__ = ('greenlet', 'waiter', 'func', 'mailbox', 'parent')
+
+    def __init__(self):
+        self.waiter = Waiter()
+        self.func = self.mailbox = self.parent = None
+
+
+class ActorPool(object):
+
+    def __init__(self, size=1000, prewarm=0, backend=None):
+        self.size = size
+        self.backend = backend
+        self._idle = []
+        self._queues = []
+        for i in range(prewarm):
+            self._idle.append(self._start_worker())
+            self._queues.append(Mailbox(backend=backend)._detach())
+
+    def spawn(self, func, link=False, **mailbox_options):
+        """Run ``func(mailbox)`` in a pooled greenlet, and return the
+        mailbox.
+        """
+        queues = self._queues.pop() if self._queues else None
+        mailbox = Mailbox(backend=self.backend, queues=queues,
+                          **mailbox_options)
+
+        worker = self._idle.pop() if self._idle else self._start_worker()
+        worker.func, worker.mailbox = func, mailbox
+        worker.parent = gevent.getcurrent() if link else None
+        run_callback(worker.waiter.switch, None)
+        return mailbox
+
+    def _start_worker(self):
+        worker = _Worker()
+        worker.greenlet = (self.backend or get_backend()).spawn(
+            self._work, worker)
+        return worker
+
+    def _work(self, worker):
+        while True:
+            worker.waiter.get()
+            func, mailbox, parent = worker.func, worker.mailbox, worker.parent
+            worker.func = worker.mailbox = worker.parent = None
+
+            try:
+                func(mailbox)
+            except Exception:
+                if parent is not None:
+                    gevent.kill(parent, LinkedFailed(
+                        worker.greenlet, sys.exc_info()[1]))
+                else:
+                    gevent.get_hub().handle_error(
+                        worker.greenlet, *sys.exc_info())
+
+            queues = mailbox._detach()
+            if queues is not None and len(self._queues) < self.size:
+                self._queues.append(queues)
+            func = mailbox = parent = None
+
+            if len(self._idle) >= self.size:
+                return
+            self._idle.append(worker)
@@ -0,0 +1,116 @@
+"""A registry of named message receivers, like Erlang's ``register/2``::
+
+    register('logger', mailbox)
+    send('logger', ('info', 'started'))
+    whereis('logger') << ('info', 'also works')
+
+The registry only holds a weak reference to the receiver; once it is garbage
+collected, the name is free again. Usually a receiver is served by a
+greenlet, and it makes sense to unregister the name as soon as the greenlet
+exits, even if the receiver lives on::
+
+    register('logger', mailbox, greenlet=gevent.spawn(log_loop, mailbox))
+
+A receiver might be started concurrently with those that want to talk to
+it. ``whereis`` and ``send`` can wait for the name to be registered::
+
+    send('logger', ('info', 'started'), timeout=5)
+
+The functions above work on a default, global registry. Create a separate
+``Registry`` if you need an isolated namespace.
+"""
+
+import weakref
+from gevent.event import Event
+
+
+__all__ = ('Registry', 'register', 'unregister', 'registered', 'whereis',
+           'send')
+
+
+class Registry(object):
+
+    def __init__(self):
+        # name -> weakref to the receiver
+        self._names = {}
+        # name -> [Event, number of waiting greenlets]
+        self._waiting = {}
+
+    def register(self, name, receiver, greenlet=None):
+        """Register ``receiver`` under ``name``. If ``greenlet`` is given,
+        the name is unregistered once it exits.
+
+        Raises ``ValueError`` if the name is already taken.
+        """
+        if self.whereis(name) is not None:
+            raise ValueError('%r is already registered' % (name,))
+        ref = weakref.ref(receiver, lambda ref: self._remove(name, ref))
+        self._names[name] = ref
+        if greenlet is not None:
+            greenlet.link(lambda g: self._remove(name, ref))
+
+        waiting = self._waiting.pop(name, None)
+        if waiting is not None:
+            waiting[0].set()
+
+    def _remove(self, name, ref):
+        # The name may have been registered again in the meantime.
+        if self._names.get(name) is ref:
+            del self._names[name]
+
+    def unregister(self, name):
+        """Free ``name``. Raises ``KeyError`` if it is not registered."""
+        del self._names[name]
+
+    def registered(self):
+        """Return a list of all registered names."""
+        return [name for name, ref in self._names.items()
+                if ref() is not None]
+
+    def whereis(self, name, timeout=0):
+        """Return the receiver registered as ``name``.
+
+        If there is none, wait up to ``timeout`` seconds (forever if
+        ``None``) for it to be registered, then return ``None``.
+        """
+        ref = self._names.get(name)
+        if ref is not None:
+            receiver = ref()
+            if receiver is not None:
+                return receiver
+        if timeout == 0:
+            return None
+
+        waiting = self._waiting.get(name)
+        if waiting is None:
+            waiting = self._waiting[name] = [Event(), 0]
+        waiting[1] += 1
+        try:
+            waiting[0].wait(timeout)
+        finally:
+            waiting[1] -= 1
+            if not waiting[1] and self._waiting.get(name) is waiting:
+                del self._waiting[name]
+        return self.whereis(name)
+
+    def send(self, name, message, timeout=0):
+        """Send ``message`` to the receiver registered as ``name``.
+
+        Raises ``KeyError`` if there is no such receiver, after waiting for
+        up to ``timeout`` seconds for it to be registered.
+        """
+        ref = self._names.get(name)
+        receiver = ref() if ref is not None else None
+        if receiver is None:
+            receiver = self.whereis(name, timeout)
+            if receiver is None:
+                raise KeyError(name)
+        receiver.receive_message(message)
+
+
+_registry = Registry()
+register = _registry.register
+unregister = _registry.unregister
+registered = _registry.registered
+whereis = _registry.whereis
+send = _registry.send
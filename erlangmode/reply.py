@@ -0,0 +1,131 @@
+"""A slim replacement for ``AsyncResult``, used by the ``|`` operator.
+
+A reply is resolved exactly once, by the mailbox that processes the request,
+and is almost always waited on by a single greenlet. ``Reply`` supports
+only that, and thus gets by without the link machinery of ``AsyncResult``.
+The familiar subset of the interface is available::
+
+    reply = mailbox | 'status'
+    reply.get(timeout=5)
+
+If you do need a full ``AsyncResult`` (say, to link to it, or to pass it to
+``gevent.wait``), ask for one::
+
+    result = reply.async_result()
+
+Reply objects can be recycled. Once you are done with a reply that is
+``ready()``, call ``release()``, and it will be reused by a later ``|``. Do
+not touch the object afterwards.
+"""
+
+from gevent.event import AsyncResult
+from gevent.hub import Waiter
+from gevent.timeout import Timeout
+from .utils import run_callback
+
+
+__all__ = ('Reply',)
+
+
+# Released replies, waiting to be reused.
+_pool = []
+POOL_SIZE = 1024
+
+
+class Reply(object):
+
+    __slots__ = ('value', '_exception', '_ready', '_waiter', '_result')
+
+    def __init__(self):
+        self._reset()
+
+    @classmethod
+    def acquire(cls):
+        """Return a recycled reply if there is one, a new one otherwise."""
+        if _pool:
+            return _pool.pop()
+        return cls()
+
+    def release(self):
+        """Put the reply back into the pool, if it is safe to do so."""
+        if self._ready and self._waiter is None and self._result is None \
+                and len(_pool) < POOL_SIZE:
+            self._reset()
+            _pool.append(self)
+
+    def _reset(self):
+        self.value = None
+        self._exception = None
+        self._ready = False
+        self._waiter = None
+        self._result = None
+
+    @property
+    def exception(self):
+        return self._exception
+
+    def ready(self):
+        return self._ready
+
+    def successful(self):
+        return self._ready and self._exception is None
+
+    def set(self, value=None):
+        self.value = value
+        self._ready = True
+        self._notify()
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self._ready = True
+        self._notify()
+
+    def _notify(self):
+        if self._waiter is not None:
+            # Waiters may only be switched to from the hub.
+            run_callback(self._waiter.switch, None)
+            self._waiter = None
+        if self._result is not None:
+            self._forward(self._result)
+
+    def _forward(self, result):
+        if self._exception is not None:
+            result.set_exception(self._exception)
+        else:
+            result.set(self.value)
+
+    def get(self, block=True, timeout=None):
+        """Return the value the request was answered with, or raise the
+        exception it failed with.
+
+        Raises ``Timeout`` if there is no reply within ``timeout`` seconds,
+        or immediately if ``block`` is false.
+        """
+        if not self._ready:
+            if not block:
+                raise Timeout()
+            assert self._waiter is None, \
+                'Only a single greenlet can wait for a reply'
+            waiter = self._waiter = Waiter()
+            timer = Timeout.start_new(timeout) if timeout is not None else None
+            try:
+                waiter.get()
+            finally:
+                if self._waiter is waiter:
+                    self._waiter = None
+                if timer is not None:
+                    timer.cancel()
+        if self._exception is not None:
+            raise self._exception
+        return self.value
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def async_result(self):
+        """Return an ``AsyncResult`` that is resolved with this reply."""
+        if self._result is None:
+            self._result = AsyncResult()
+            if self._ready:
+                self._forward(self._result)
+        return self._result
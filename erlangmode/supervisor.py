@@ -0,0 +1,196 @@
+"""Erlang-style supervisors, restarting greenlets that fail::
+
+    sup = Supervisor(strategy=ONE_FOR_ONE, intensity=3, period=5)
+    sup.add_child(accept_loop)
+    worker = sup.add_child(work_loop, mailbox=Mailbox())
+    sup.start()
+
+    worker.mailbox << ('job', 42)
+
+A child is a function that is run in its own greenlet. If it is given a
+``mailbox``, it is called with the mailbox as its only argument; since the
+same mailbox is passed to every incarnation of the child, messages that
+are queued while the child restarts are not lost.
+
+When a child exits, the supervisor restarts children according to its
+``strategy``:
+
+``ONE_FOR_ONE``
+    Only the child that exited is restarted.
+``ONE_FOR_ALL``
+    All children are terminated and restarted.
+``REST_FOR_ONE``
+    The child that exited, and all children added after it, are terminated
+    and restarted.
+
+Whether a child is restarted at all depends on its ``restart`` type:
+``PERMANENT`` children are always restarted, ``TRANSIENT`` children only if
+they failed with an exception. ``TEMPORARY`` children are never restarted,
+and are removed once they exit, or are terminated along with a sibling.
+
+If there are more than ``intensity`` restarts within ``period`` seconds,
+the supervisor gives up: It terminates all children and fails with
+``MaxRestartsExceeded``. Supervisors can thus be nested; a supervisor can
+be the child of another supervisor by adding its ``run`` method::
+
+    parent.add_child(sup.run)
+
+To keep a crashing child from hogging the CPU, restarts can be delayed with
+an exponential backoff: The n-th restart within ``period`` is delayed by
+``backoff * 2**(n-1)`` seconds, up to ``max_backoff``.
+"""
+
+from collections import deque
+import gevent
+from .mailbox import Actor
+from .links import spawn_and_link
+from .utils import send_after
+
+
+__all__ = ('Supervisor', 'MaxRestartsExceeded', 'ONE_FOR_ONE', 'ONE_FOR_ALL',
+           'REST_FOR_ONE', 'PERMANENT', 'TRANSIENT', 'TEMPORARY')
+
+
+ONE_FOR_ONE = 'one_for_one'
+ONE_FOR_ALL = 'one_for_all'
+REST_FOR_ONE = 'rest_for_one'
+
+PERMANENT = 'permanent'
+TRANSIENT = 'transient'
+TEMPORARY = 'temporary'
+
+
+class MaxRestartsExceeded(Exception):
+    """Raised by a supervisor whose children restart too often."""
+
+
+class Child(object):
+    """The specification of a supervised child, and its current greenlet."""
+
+    def __init__(self, func, mailbox=None, restart=PERMANENT):
+        assert restart in (PERMANENT, TRANSIENT, TEMPORARY), \
+            'Unknown restart type: %s' % restart
+        self.func = func
+        self.mailbox = mailbox
+        self.restart = restart
+        self.greenlet = None
+
+    def __call__(self):
+        if self.mailbox is not None:
+            return self.func(self.mailbox)
+        return self.func()
+
+
+class Supervisor(Actor):
+
+    def __init__(self, strategy=ONE_FOR_ONE, intensity=3, period=5,
+                 backoff=0, max_backoff=1):
+        Actor.__init__(self)
+        assert strategy in (ONE_FOR_ONE, ONE_FOR_ALL, REST_FOR_ONE), \
+            'Unknown strategy: %s' % strategy
+        self.strategy = strategy
+        self.intensity = intensity
+        self.period = period
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.children = []
+        self.greenlet = None
+        self._running = {}
+        self._restarts = deque()
+
+    def add_child(self, func, mailbox=None, restart=PERMANENT):
+        """Add a child, which is started right away if the supervisor is
+        already running. Returns the ``Child``.
+        """
+        child = Child(func, mailbox, restart)
+        self.children.append(child)
+        if self.greenlet is not None:
+            self << ('start', [child])
+        return child
+
+    def start(self):
+        """Run the supervisor in a new greenlet, and return it."""
+        assert self.greenlet is None, 'Supervisor is already running'
+        self.greenlet = self.backend.spawn(self.run)
+        return self.greenlet
+
+    def stop(self):
+        """Terminate all children, and the supervisor itself."""
+        if self.greenlet is not None:
+            self.greenlet.kill()
+
+    def run(self):
+        if self.greenlet is None:
+            self.greenlet = gevent.getcurrent()
+        # A new incarnation, say after being restarted by a parent
+        # supervisor, does not inherit the restarts of the previous one.
+        self._restarts.clear()
+        self._running.clear()
+        try:
+            self._start(self.children)
+            for receive in self.mailbox:
+                if receive('EXIT', object, object):
+                    greenlet, exception = receive.match
+                    self._exited(greenlet, exception)
+                if receive('start', list):
+                    self._start(receive.match[0])
+        finally:
+            self._terminate(self.children)
+            self.greenlet = None
+
+    def _start(self, children):
+        for child in children:
+            if child.greenlet is None:
+                child.greenlet = spawn_and_link(child, trap_exit=self)
+                self._running[child.greenlet] = child
+
+    def _terminate(self, children):
+        # In the reverse order they were started in.
+        for child in reversed(children):
+            greenlet, child.greenlet = child.greenlet, None
+            if greenlet is not None:
+                del self._running[greenlet]
+                greenlet.kill()
+
+    def _exited(self, greenlet, exception):
+        child = self._running.pop(greenlet, None)
+        if child is None:
+            # We terminated this one ourselves.
+            return
+        child.greenlet = None
+
+        if child.restart == TEMPORARY:
+            self.children.remove(child)
+            return
+        if child.restart == TRANSIENT and exception is None:
+            return
+
+        now = self.backend.time()
+        while self._restarts and now - self._restarts[0] >= self.period:
+            self._restarts.popleft()
+        self._restarts.append(now)
+        if len(self._restarts) > self.intensity:
+            raise MaxRestartsExceeded(
+                '%d restarts within %s seconds' % (
+                    len(self._restarts), self.period))
+
+        if self.strategy == ONE_FOR_ONE:
+            group = [child]
+        elif self.strategy == ONE_FOR_ALL:
+            group = self.children[:]
+        else:
+            group = self.children[self.children.index(child):]
+        self._terminate(group)
+        # Temporary siblings are not restarted along with the child either.
+        for sibling in [c for c in group if c.restart == TEMPORARY]:
+            self.children.remove(sibling)
+            group.remove(sibling)
+
+        delay = 0
+        if self.backoff:
+            delay = min(self.backoff * 2 ** (len(self._restarts) - 1),
+                        self.max_backoff)
+        if delay:
+            send_after(delay, self, ('start', group))
+        else:
+            self._start(group)
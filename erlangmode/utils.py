@@ -8,6 +8,10 @@ __all__ = ('send_after',)
 if gevent.__version__ <= '0.13.6':
     # This is the old version that used libevent
 
+    def run_callback(callable, *args):
+        """Have the hub call ``callable`` soon."""
+        gevent.core.active_event(callable, *args)
+
     class Timer(object):
         __slots__ = ('_seconds', '_callable', '_timer')
 
@@ -32,6 +36,10 @@ if gevent.__version__ <= '0.13.6':
 
 else:
     # New gevent versions use libev
+    def run_callback(callable, *args):
+        """Have the hub call ``callable`` soon."""
+        gevent.get_hub().loop.run_callback(callable, *args)
+
     class Timer(object):
 
         __slots__ = ('_seconds', '_callable', '_timer')
@@ -68,7 +76,11 @@ def send_after(seconds, mailbox, message):
     """After ``seconds``, add ``message`` to ``mailbox``.
 
     Returns a ``Timer`` object that allows the event to be canceled and reset.
+    The timer runs on the backend of ``mailbox``.
     """
     if seconds is not None and not seconds >= 0:
         raise IOError(22, 'Invalid argument')
-    return Timer(seconds, lambda: mailbox << message)
+    # Imported here, as the backends are built from the utilities in here.
+    from .backend import get_backend
+    backend = getattr(mailbox, 'backend', None) or get_backend()
+    return backend.timer(seconds, lambda: mailbox << message)
@@ -1,8 +1,44 @@
 import gevent
 
-__all__ = ('STEP', 'step')
+__all__ = ('STEP', 'step', 'assert_raises', 'count_switches')
 
 
 STEP = .1
 def step():
     gevent.sleep(STEP)
+
+
+def assert_raises(exception, callable, *args, **kwargs):
+    """Like ``nose.tools.assert_raises``, which needs a Python that nose
+    still supports.
+    """
+    try:
+        callable(*args, **kwargs)
+    except exception:
+        return
+    raise AssertionError('%s not raised' % exception.__name__)
+
+
+def count_switches(mailbox, messages):
+    """Send ``messages`` numbers to ``mailbox`` and receive them all.
+    Returns how often another greenlet got to run in the meantime.
+    """
+    switches = []
+    def other():
+        while True:
+            switches.append(1)
+            gevent.sleep(0)
+    gl = gevent.spawn(other)
+    gevent.sleep(0)
+    del switches[:]
+
+    for i in range(messages):
+        mailbox << i
+    for receive in mailbox:
+        if receive(messages-1):
+            break
+        if receive(int):
+            pass
+    count = len(switches)
+    gl.kill()
+    return count
@@ -0,0 +1,209 @@
+"""The asyncio backend. Python 3 only; nose on Python 2 skips this file
+via ``-e aio`` (see tox.ini).
+"""
+
+import asyncio
+from erlangmode import Mailbox, Actor, send_after
+from erlangmode.aio import AsyncioBackend, AsyncReply
+from base import *
+
+
+def run(coroutine_function):
+    return asyncio.run(coroutine_function())
+
+
+def mailbox(**kwargs):
+    return Mailbox(backend=AsyncioBackend(), **kwargs)
+
+
+async def count_task_switches(mailbox, messages):
+    """``count_switches`` from ``base``, with tasks instead of greenlets;
+    it cannot live there, since base is imported on Python 2 as well.
+    """
+    switches = []
+    async def other():
+        while True:
+            switches.append(1)
+            await asyncio.sleep(0)
+    task = asyncio.ensure_future(other())
+    await asyncio.sleep(0)
+    del switches[:]
+
+    for i in range(messages):
+        mailbox << i
+    async for receive in mailbox:
+        if receive(messages-1):
+            break
+        if receive(int):
+            pass
+    task.cancel()
+    return len(switches)
+
+
+class TestReceive(object):
+
+    def test_selective(self):
+        async def main():
+            mb = mailbox()
+            mb << 'a' << 'b' << 'c'
+            received = []
+            async for receive in mb:
+                if receive('c'):
+                    received.append('c')
+                    break
+                if receive('a'):
+                    received.append('a')
+            assert received == ['a', 'c']
+            assert mb._save_queue.get_nowait() == (None, 'b')
+        run(main)
+
+    def test_pattern(self):
+        async def main():
+            mb = mailbox()
+            mb << ('sum', 5, 2)
+            async for receive in mb:
+                if receive('sum', int, int):
+                    assert receive.match == (5, 2)
+                    break
+        run(main)
+
+    def test_block(self):
+        async def main():
+            mb = mailbox()
+            asyncio.get_running_loop().call_later(STEP*0.5, lambda: mb << 'a')
+            async for receive in mb:
+                if receive('a'):
+                    break
+        run(main)
+
+    def test_timeout(self):
+        async def main():
+            mb = mailbox()
+            asyncio.get_running_loop().call_later(STEP*1.5, lambda: mb << 'a')
+            timed_out = False
+            async for receive in mb:
+                if receive('a'):
+                    break
+                if receive(timeout=STEP):
+                    timed_out = True
+            return timed_out
+        assert run(main)
+
+    def test_zero_timeout(self):
+        async def main():
+            timed_out = False
+            async for receive in mailbox():
+                if receive(timeout=0):
+                    timed_out = True
+            return timed_out
+        assert run(main)
+
+    def test_spawn(self):
+        async def main():
+            mb = mailbox()
+            async def actor(mailbox):
+                async for receive in mailbox:
+                    if receive(int):
+                        receive.respond(receive.message + 1)
+                        break
+            task = mb.backend.spawn(actor, mb)
+            assert await (mb | 1) == 2
+            await task
+        run(main)
+
+    def test_wrong_loop(self):
+        """``for`` is rejected on asyncio, ``async for`` on gevent."""
+        try:
+            for receive in mailbox():
+                pass
+        except TypeError as e:
+            assert 'async for' in str(e)
+        else:
+            raise AssertionError('TypeError not raised')
+
+        async def main():
+            async for receive in Mailbox():
+                pass
+        try:
+            run(main)
+        except TypeError as e:
+            assert 'GeventBackend' in str(e)
+        else:
+            raise AssertionError('TypeError not raised')
+
+    def test_reductions(self):
+        async def main():
+            return await count_task_switches(mailbox(reductions=10), 100)
+        assert run(main) >= 9
+
+
+class TestReply(object):
+
+    def test_respond(self):
+        async def main():
+            mb = mailbox()
+            async def loop():
+                async for receive in mb:
+                    if receive(int):
+                        receive.respond(receive.message * 2)
+                    if receive('silent'):
+                        pass
+            task = asyncio.ensure_future(loop())
+            reply = mb | 21
+            assert isinstance(reply, AsyncReply)
+            assert await reply == 42
+            assert await (mb | 'silent') is None
+            task.cancel()
+        run(main)
+
+    def test_implicit_on_break(self):
+        """The reply is resolved right after a ``break``."""
+        async def main():
+            mb = mailbox()
+            reply = mb | 'a'
+            async for receive in mb:
+                if receive('a'):
+                    break
+            assert reply.done()
+        run(main)
+
+    def test_actor(self):
+        async def main():
+            actor = Actor(backend=AsyncioBackend())
+            assert isinstance(actor | 1, AsyncReply)
+        run(main)
+
+
+class TestTimer(object):
+
+    def test_send_after(self):
+        async def main():
+            mb = mailbox()
+            send_after(STEP*0.5, mb, 42)
+            await asyncio.sleep(STEP)
+            assert mb._mailbox.qsize() == 1
+        run(main)
+
+    def test_cancel_reset(self):
+        async def main():
+            mb = mailbox()
+            t = send_after(STEP*1.5, mb, 42)
+            await asyncio.sleep(STEP)
+            t.reset()
+            await asyncio.sleep(STEP)
+            assert mb._mailbox.qsize() == 0
+            t.cancel()
+            await asyncio.sleep(STEP)
+            assert mb._mailbox.qsize() == 0
+        run(main)
+
+    def test_get_timeout(self):
+        async def main():
+            backend = AsyncioBackend()
+            try:
+                await backend.get(backend.queue(), STEP*0.5)
+            except backend.Empty:
+                pass
+            else:
+                raise AssertionError('Empty not raised')
+        run(main)
@@ -0,0 +1,118 @@
+import time
+import gevent
+from erlangmode import Mailbox, GeventBackend, VirtualClock, send_after
+from base import *
+
+
+class TestVirtualClock(object):
+
+    def setup_method(self, method=None):
+        self.clock = VirtualClock()
+        self.backend = GeventBackend(clock=self.clock)
+
+    # nose calls this instead.
+    setup = setup_method
+
+    def mailbox(self):
+        return Mailbox(backend=self.backend)
+
+    def test_timeout(self):
+        """A long timeout passes instantly, in virtual time."""
+        mb = self.mailbox()
+        start = time.time()
+        timed_out = False
+        for receive in mb:
+            if receive(timeout=3600):
+                timed_out = True
+        assert timed_out
+        assert self.clock.time() == 3600
+        assert time.time() - start < 1
+
+    def test_message_before_timeout(self):
+        mb = self.mailbox()
+        send_after(10, mb, 'a')
+        for receive in mb:
+            if receive('a'):
+                break
+            if receive(timeout=20):
+                raise AssertionError('timed out')
+        assert self.clock.time() == 10
+
+    def test_total_timeout(self):
+        """Non-matching messages do not reset the timeout."""
+        mb = self.mailbox()
+        send_after(5, mb, 'not matching')
+        send_after(15, mb, 'match')
+        timed_out = False
+        for receive in mb:
+            if receive('match'):
+                break
+            if receive(timeout=10):
+                timed_out = True
+        assert timed_out
+        assert self.clock.time() == 10
+
+    def test_many(self):
+        """Thousands of timeouts, finished in deterministic order."""
+        order = []
+        def waiter(i):
+            for receive in self.mailbox():
+                if receive(timeout=i % 100):
+                    order.append((self.clock.time(), i))
+        start = time.time()
+        gevent.joinall([gevent.spawn(waiter, i) for i in range(2000)])
+        assert len(order) == 2000
+        assert order == sorted(order)
+        assert time.time() - start < 10
+
+    def test_send_after(self):
+        mb = self.mailbox()
+        send_after(1.5, mb, 42)
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 0
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 1
+        assert self.clock.time() == 2
+
+    def test_cancel(self):
+        mb = self.mailbox()
+        t = send_after(1.5, mb, 42)
+        self.backend.sleep(1)
+        t.cancel()
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 0
+
+    def test_reset(self):
+        mb = self.mailbox()
+        t = send_after(1.5, mb, 42)
+        self.backend.sleep(1)
+        t.reset()
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 0
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 1
+
+    def test_none_value(self):
+        mb = self.mailbox()
+        t = send_after(None, mb, 42)
+        t.reset()
+        t.cancel()
+        self.backend.sleep(1)
+        assert mb._mailbox.qsize() == 0
+
+    def test_busy(self):
+        """Time does not advance while other greenlets can run."""
+        ran = []
+        def busy():
+            for i in range(100):
+                ran.append(self.clock.time())
+                gevent.sleep(0)
+        gevent.spawn(busy)
+        self.backend.sleep(1)
+        assert len(ran) == 100 and set(ran) == set([0])
+
+    def test_reduction_time(self):
+        """Reduction time budgets use real time."""
+        mb = Mailbox(backend=self.backend, reductions=None,
+                     reduction_time=1e-9)
+        assert count_switches(mb, 10) >= 9
@@ -0,0 +1,31 @@
+import gevent
+from erlangmode import Mailbox, spawn_and_link, LinkedFailed
+from base import *
+
+
+class TestSpawnAndLink(object):
+
+    def test_failure(self):
+        def parent():
+            spawn_and_link(lambda: 1/0)
+            gevent.sleep(STEP)
+        gl = gevent.spawn(parent)
+        gl.join()
+        assert isinstance(gl.exception, LinkedFailed)
+
+    def test_trap_exit(self):
+        mb = Mailbox()
+        failed = spawn_and_link(lambda: 1/0, trap_exit=mb)
+        ok = spawn_and_link(lambda: None, trap_exit=mb)
+        gevent.joinall([failed, ok])
+        step()
+
+        exits = {}
+        for receive in mb:
+            if receive('EXIT', object, object):
+                greenlet, exception = receive.match
+                exits[greenlet] = exception
+            if receive(timeout=0):
+                break
+        assert isinstance(exits[failed], ZeroDivisionError)
+        assert exits[ok] is None
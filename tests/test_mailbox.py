@@ -1,6 +1,5 @@
 import gevent
 from gevent.timeout import Timeout
-from nose.tools import assert_raises
 from erlangmode import Mailbox, Actor
 from erlangmode.mailbox import match
 from base import *
@@ -215,6 +214,37 @@ class TestReceive(object):
         gl.kill()
 
 
+class TestReductions(object):
+    """A busy receive loop yields to other greenlets."""
+
+    def test_reductions(self):
+        assert count_switches(Mailbox(reductions=10), 100) >= 9
+
+    def test_disabled(self):
+        mb = Mailbox(reductions=None)
+        assert count_switches(mb, 100) == 0
+
+    def test_reduction_time(self):
+        mb = Mailbox(reductions=None, reduction_time=0)
+        assert count_switches(mb, 10) >= 9
+
+    def test_budget_survives_break(self):
+        """The budget is per mailbox, not per loop."""
+        mb = Mailbox(reductions=10)
+        mb._reductions_used = 10
+        ran = []
+        gevent.spawn(lambda: ran.append(1))
+        mb << 'a'
+        for receive in mb:
+            if receive('a'):
+                break
+        assert ran
+
+    def test_actor(self):
+        actor = Actor(reductions=5)
+        assert actor.mailbox.reductions == 5
+
+
 class TestMatching(object):
     """Test the specific matching.
     """
@@ -0,0 +1,88 @@
+import gevent
+from gevent.timeout import Timeout
+from erlangmode import Mailbox, multi_call, Pipeline
+from base import *
+
+
+def responder(mailbox, delay=0):
+    def loop():
+        for receive in mailbox:
+            if receive(int):
+                gevent.sleep(delay)
+                receive.respond(receive.message * 2)
+            if receive('silent'):
+                pass
+    return gevent.spawn(loop)
+
+
+class TestMultiCall(object):
+
+    def setup_method(self, method=None):
+        self.greenlets = []
+
+    def teardown_method(self, method=None):
+        gevent.killall(self.greenlets)
+
+    # nose calls these instead.
+    setup, teardown = setup_method, teardown_method
+
+    def spawn(self, delay=0):
+        mb = Mailbox()
+        self.greenlets.append(responder(mb, delay))
+        return mb
+
+    def test(self):
+        mailboxes = [self.spawn() for i in range(5)]
+        replies, errors = multi_call(mailboxes, 21)
+        assert replies == [(mb, 42) for mb in mailboxes]
+        assert errors == []
+
+    def test_implicit_response(self):
+        """Receivers that do not respond() reply with None."""
+        mailboxes = [self.spawn() for i in range(3)]
+        replies, errors = multi_call(mailboxes, 'silent')
+        assert replies == [(mb, None) for mb in mailboxes]
+
+    def test_no_receivers(self):
+        assert multi_call([], 1) == ([], [])
+
+    def test_partial(self):
+        """At the deadline, the replies received so far are returned."""
+        fast = self.spawn()
+        slow = [self.spawn(delay=STEP*2) for i in range(2)]
+        replies, errors = multi_call([fast] + slow, 1, timeout=STEP)
+        assert replies == [(fast, 2)]
+        assert [receiver for receiver, e in errors] == slow
+        assert isinstance(errors[0][1], Timeout)
+        # One exception is shared by all late receivers.
+        assert errors[0][1] is errors[1][1]
+
+    def test_late_reply(self):
+        """Replies arriving after the deadline are dropped."""
+        slow = self.spawn(delay=STEP)
+        pipeline = Pipeline().call(slow, 1)
+        replies, errors = pipeline.gather(timeout=0)
+        assert replies == [] and errors[0][0] is slow
+        step(); step()
+        replies, errors = pipeline.gather()
+        assert replies == [] and errors[0][0] is slow
+
+    def test_exception(self):
+        class Receiver(object):
+            def receive_message(self, message, responder=None):
+                responder.set_exception(ValueError(message))
+        receiver = Receiver()
+        replies, errors = multi_call([receiver], 'bad')
+        assert replies == []
+        assert errors[0][0] is receiver
+        assert isinstance(errors[0][1], ValueError)
+
+
+class TestPipeline(object):
+
+    def test(self):
+        a, b = Mailbox(), Mailbox()
+        greenlets = [responder(a), responder(b)]
+        replies, errors = Pipeline().call(a, 1).call(b, 2).call(a, 3).gather()
+        assert replies == [(a, 2), (b, 4), (a, 6)]
+        gevent.killall(greenlets)
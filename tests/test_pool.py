@@ -0,0 +1,113 @@
+import gevent
+from erlangmode import ActorPool, Mailbox, LinkedFailed, ActorExited
+from base import *
+
+
+def echo(log):
+    def actor(mailbox):
+        log.append(gevent.getcurrent())
+        for receive in mailbox:
+            if receive(object):
+                receive.respond(receive.message)
+                break
+    return actor
+
+
+class TestActorPool(object):
+
+    def test_spawn(self):
+        pool = ActorPool()
+        log = []
+        mailbox = pool.spawn(echo(log))
+        assert isinstance(mailbox, Mailbox)
+        assert (mailbox | 42).get(timeout=STEP) == 42
+
+    def test_reuse(self):
+        """Greenlets and queues are reused."""
+        pool = ActorPool()
+        log = []
+        first = pool.spawn(echo(log))
+        (first | 1).get(timeout=STEP)
+        gevent.sleep(0)
+        queue = first._mailbox
+
+        second = pool.spawn(echo(log))
+        (second | 2).get(timeout=STEP)
+        assert log[0] is log[1]
+        assert second is not first
+        assert second._mailbox is queue
+
+    def test_prewarm(self):
+        pool = ActorPool(prewarm=5)
+        assert len(pool._idle) == 5 and len(pool._queues) == 5
+        log = []
+        for i in range(5):
+            pool.spawn(echo(log)) << i
+        step()
+        assert len(set(log)) == 5
+        assert len(pool._idle) == 5
+
+    def test_size(self):
+        pool = ActorPool(size=2)
+        mailboxes = [pool.spawn(echo([])) for i in range(5)]
+        for mailbox in mailboxes:
+            mailbox << 1
+        step()
+        assert len(pool._idle) == 2
+        assert len(pool._queues) == 2
+
+    def test_stale_messages(self):
+        """Messages sent to a finished actor do not reach the next one."""
+        pool = ActorPool()
+        log = []
+        first = pool.spawn(echo(log))
+        first << 1
+        step()
+        second = pool.spawn(lambda mailbox: None)
+        first << 2
+        assert second._mailbox.qsize() == 0
+
+    def test_request_after_exit(self):
+        """Requests to a finished actor fail instead of blocking."""
+        pool = ActorPool()
+        mailbox = pool.spawn(echo([]))
+        mailbox << 1
+        step()
+        assert_raises(ActorExited, (mailbox | 2).get)
+
+    def test_request_queued_at_exit(self):
+        """Requests left in the mailbox of a finished actor fail, as do
+        requests sent afterwards.
+        """
+        pool = ActorPool()
+        mailbox = pool.spawn(echo([]))
+        first, queued = mailbox | 1, mailbox | 2
+        assert first.get(timeout=STEP) == 1
+        assert_raises(ActorExited, queued.get, timeout=STEP)
+        assert_raises(ActorExited, (mailbox | 3).get, timeout=STEP)
+        assert pool._queues == []
+
+    def test_not_empty(self):
+        """Queues with leftover messages are not recycled."""
+        pool = ActorPool()
+        mailbox = pool.spawn(echo([]))
+        mailbox << 1 << 2
+        step()
+        assert pool._queues == []
+
+    def test_link(self):
+        pool = ActorPool()
+        def parent():
+            pool.spawn(lambda mailbox: 1/0, link=True)
+            gevent.sleep(STEP)
+        gl = gevent.spawn(parent)
+        gl.join()
+        assert isinstance(gl.exception, LinkedFailed)
+        assert 'ZeroDivisionError' in str(gl.exception)
+        # The greenlet survived, and is back in the pool.
+        assert len(pool._idle) == 1
+
+    def test_mailbox_options(self):
+        pool = ActorPool()
+        mailbox = pool.spawn(lambda mailbox: None, reductions=5)
+        assert mailbox.reductions == 5
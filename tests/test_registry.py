@@ -0,0 +1,74 @@
+import gc
+import gevent
+from erlangmode import Mailbox, Actor, Registry
+from base import *
+
+
+class TestRegistry(object):
+
+    def setup_method(self, method=None):
+        self.registry = Registry()
+
+    # nose calls this instead.
+    setup = setup_method
+
+    def test(self):
+        mb = Mailbox()
+        self.registry.register('foo', mb)
+        assert self.registry.whereis('foo') is mb
+        assert self.registry.registered() == ['foo']
+
+        self.registry.send('foo', 42)
+        assert mb._mailbox.get_nowait() == (None, 42)
+
+        self.registry.unregister('foo')
+        assert self.registry.whereis('foo') is None
+
+    def test_unknown(self):
+        assert self.registry.whereis('foo') is None
+        assert_raises(KeyError, self.registry.send, 'foo', 42)
+        assert_raises(KeyError, self.registry.unregister, 'foo')
+
+    def test_duplicate(self):
+        mb = Mailbox()
+        self.registry.register('foo', mb)
+        assert_raises(ValueError, self.registry.register, 'foo', Actor())
+
+    def test_garbage_collected(self):
+        self.registry.register('foo', Actor())
+        gc.collect()
+        assert self.registry.whereis('foo') is None
+        # The name can be reused.
+        self.registry.register('foo', Mailbox())
+
+    def test_greenlet(self):
+        """The name is unregistered when the greenlet exits."""
+        mb = Mailbox()
+        gl = gevent.spawn(gevent.sleep, STEP*0.5)
+        self.registry.register('foo', mb, greenlet=gl)
+        assert self.registry.whereis('foo') is mb
+        step()
+        assert self.registry.whereis('foo') is None
+
+    def test_greenlet_reregistered(self):
+        """A dead greenlet does not remove a newer registration."""
+        old = Mailbox()
+        gl = gevent.spawn(gevent.sleep, STEP*0.5)
+        self.registry.register('foo', old, greenlet=gl)
+        self.registry.unregister('foo')
+        mb = Mailbox()
+        self.registry.register('foo', mb)
+        step()
+        assert self.registry.whereis('foo') is mb
+
+    def test_wait(self):
+        mb = Mailbox()
+        gevent.spawn_later(STEP*0.5, self.registry.register, 'foo', mb)
+        self.registry.send('foo', 42, timeout=STEP)
+        assert mb._mailbox.get_nowait() == (None, 42)
+        assert self.registry._waiting == {}
+
+    def test_wait_timeout(self):
+        assert self.registry.whereis('foo', timeout=STEP*0.5) is None
+        assert_raises(KeyError, self.registry.send, 'foo', 42, timeout=STEP*0.5)
+        assert self.registry._waiting == {}
@@ -0,0 +1,68 @@
+import gevent
+from gevent.timeout import Timeout
+from erlangmode import Mailbox, Reply
+from base import *
+
+
+class TestReply(object):
+
+    def test_set(self):
+        reply = Reply()
+        assert not reply.ready()
+        gevent.spawn_later(STEP*0.5, reply.set, 42)
+        assert reply.get() == 42
+        assert reply.ready() and reply.successful()
+
+    def test_already_set(self):
+        reply = Reply()
+        reply.set(42)
+        assert reply.get() == 42
+        assert reply.get_nowait() == 42
+
+    def test_timeout(self):
+        reply = Reply()
+        assert_raises(Timeout, reply.get, timeout=STEP*0.5)
+        assert_raises(Timeout, reply.get_nowait)
+        # Can still be waited on afterwards.
+        reply.set(1)
+        assert reply.get(timeout=STEP) == 1
+
+    def test_exception(self):
+        reply = Reply()
+        gevent.spawn_later(STEP*0.5, reply.set_exception, ValueError('foo'))
+        assert_raises(ValueError, reply.get)
+        assert reply.ready() and not reply.successful()
+        assert isinstance(reply.exception, ValueError)
+
+    def test_async_result(self):
+        reply = Reply()
+        result = reply.async_result()
+        assert reply.async_result() is result
+        reply.set(42)
+        assert result.get(timeout=0) == 42
+
+        reply = Reply()
+        reply.set_exception(ValueError())
+        assert_raises(ValueError, reply.async_result().get, timeout=0)
+
+    def test_pool(self):
+        reply = Reply.acquire()
+        # Not yet ready, will not be recycled.
+        reply.release()
+        assert Reply.acquire() is not reply
+
+        reply.set(42)
+        reply.release()
+        recycled = Reply.acquire()
+        assert recycled is reply
+        assert not recycled.ready() and recycled.value is None
+
+    def test_mailbox(self):
+        mb = Mailbox()
+        reply = mb | 'a'
+        assert isinstance(reply, Reply)
+        for receive in mb:
+            if receive('a'):
+                receive.respond('b')
+                break
+        assert reply.get(timeout=0) == 'b'
@@ -0,0 +1,180 @@
+import gevent
+from erlangmode import Mailbox, Supervisor, MaxRestartsExceeded, \
+    ONE_FOR_ONE, ONE_FOR_ALL, REST_FOR_ONE, TRANSIENT, TEMPORARY
+from base import *
+
+
+class Crasher(object):
+    """A child that records its starts, and fails when told to."""
+
+    def __init__(self, name, log):
+        self.name, self.log = name, log
+        self.mailbox = Mailbox()
+
+    def __call__(self, mailbox):
+        self.log.append(self.name)
+        for receive in mailbox:
+            if receive('crash'):
+                raise ValueError(self.name)
+            if receive('exit'):
+                return
+
+
+class TestSupervisor(object):
+
+    def setup_method(self, method=None):
+        self.log = []
+        self.sups = []
+
+    def teardown_method(self, method=None):
+        for sup in self.sups:
+            sup.stop()
+
+    # nose calls these instead.
+    setup, teardown = setup_method, teardown_method
+
+    def run(self, names, **kwargs):
+        restart = kwargs.pop('restart', None)
+        sup = Supervisor(**kwargs)
+        self.sups.append(sup)
+        children = {}
+        for name in names:
+            crasher = Crasher(name, self.log)
+            child = sup.add_child(crasher, mailbox=crasher.mailbox,
+                                  **({'restart': restart} if restart else {}))
+            children[name] = child
+        sup.start()
+        step()
+        del self.log[:]
+        return sup, children
+
+    def test_one_for_one(self):
+        sup, children = self.run('abc', strategy=ONE_FOR_ONE)
+        children['b'].mailbox << 'crash'
+        step()
+        assert self.log == ['b']
+
+    def test_one_for_all(self):
+        sup, children = self.run('abc', strategy=ONE_FOR_ALL)
+        children['b'].mailbox << 'crash'
+        step()
+        assert self.log == ['a', 'b', 'c']
+
+    def test_rest_for_one(self):
+        sup, children = self.run('abc', strategy=REST_FOR_ONE)
+        children['b'].mailbox << 'crash'
+        step()
+        assert self.log == ['b', 'c']
+
+    def test_mailbox_kept(self):
+        """Messages sent while the child restarts are not lost."""
+        sup, children = self.run('a', backoff=STEP)
+        mailbox = children['a'].mailbox
+        mailbox << 'crash' << 'crash'
+        gevent.sleep(STEP*4)
+        # Started twice more, and processed both messages.
+        assert self.log == ['a', 'a']
+        assert mailbox._mailbox.qsize() == 0
+
+    def test_restart_types(self):
+        sup, children = self.run('a', restart=TRANSIENT)
+        children['a'].mailbox << 'exit'
+        step()
+        assert self.log == []
+        assert sup.children == [children['a']]
+
+        sup, children = self.run('b', restart=TEMPORARY)
+        children['b'].mailbox << 'crash'
+        step()
+        assert self.log == []
+        assert sup.children == []
+
+    def run_mixed(self, strategy):
+        sup = Supervisor(strategy=strategy)
+        self.sups.append(sup)
+        children = {}
+        for name, restart in (('a', None), ('temp', TEMPORARY),
+                              ('trans', TRANSIENT)):
+            crasher = Crasher(name, self.log)
+            children[name] = sup.add_child(
+                crasher, mailbox=crasher.mailbox,
+                **({'restart': restart} if restart else {}))
+        sup.start()
+        step()
+        del self.log[:]
+        children['a'].mailbox << 'crash'
+        step()
+        return sup, children
+
+    def test_one_for_all_temporary(self):
+        """Temporary siblings are terminated, but not restarted."""
+        sup, children = self.run_mixed(ONE_FOR_ALL)
+        assert self.log == ['a', 'trans']
+        assert sup.children == [children['a'], children['trans']]
+
+    def test_rest_for_one_temporary(self):
+        sup, children = self.run_mixed(REST_FOR_ONE)
+        assert self.log == ['a', 'trans']
+        assert sup.children == [children['a'], children['trans']]
+
+    def test_intensity(self):
+        sup, children = self.run('ab', intensity=2, period=10)
+        supervisor, sibling = sup.greenlet, children['b'].greenlet
+        mailbox = children['a'].mailbox
+        mailbox << 'crash'
+        step()
+        mailbox << 'crash'
+        step()
+        assert sup.greenlet is not None
+        mailbox << 'crash'
+        step()
+        assert sup.greenlet is None
+        assert children['b'].greenlet is None
+        assert sibling.dead
+        assert isinstance(supervisor.exception, MaxRestartsExceeded)
+
+    def test_intensity_failure(self):
+        """The supervisor itself fails, so that a parent can react."""
+        sup = Supervisor(intensity=0)
+        sup.add_child(lambda: 1/0)
+        gl = sup.start()
+        gl.join(timeout=STEP)
+        assert isinstance(gl.exception, MaxRestartsExceeded)
+
+    def test_nested_restart(self):
+        """A restarted supervisor starts with a clean restart window."""
+        inner = Supervisor(intensity=1, period=10)
+        crasher = Crasher('a', self.log)
+        inner.add_child(crasher, mailbox=crasher.mailbox)
+        outer = Supervisor(intensity=5, period=10)
+        outer.add_child(inner.run)
+        self.sups.append(outer)
+        outer.start()
+        step()
+
+        # Two crashes exceed the inner intensity; the outer restarts it.
+        crasher.mailbox << 'crash'
+        step()
+        crasher.mailbox << 'crash'
+        step()
+        assert len(outer._restarts) == 1
+
+        # One more crash is within the limits of the new incarnation.
+        crasher.mailbox << 'crash'
+        step()
+        assert len(outer._restarts) == 1
+        assert len(inner._restarts) == 1
+
+    def test_add_child_running(self):
+        sup, children = self.run('a')
+        crasher = Crasher('b', self.log)
+        sup.add_child(crasher, mailbox=crasher.mailbox)
+        step()
+        assert self.log == ['b']
+
+    def test_stop(self):
+        sup, children = self.run('ab')
+        greenlets = [c.greenlet for c in children.values()]
+        sup.stop()
+        assert all(g.dead for g in greenlets)
+        assert sup.greenlet is None